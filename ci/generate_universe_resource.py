@@ -19,11 +19,13 @@ resource =	{
   }
 }
 
+session = requests.Session()
+
 for platform in ['linux', 'darwin', 'windows']:
     url = url_pattern.format(platform=platform)
 
     sha = hash.sha256()
-    r = requests.get(url, stream=True)
+    r = session.get(url, stream=True)
     for chunk in r.iter_content(1024):
         sha.update(chunk)
 
@@ -72,9 +72,11 @@ expectations = [
     )
 ]
 
+session = requests.Session()
+
 for url, expected_version in expectations:
     print('Verifying ' + url + '...')
-    r = requests.get(url, stream=True)
+    r = session.get(url, stream=True)
     fd, binary = tempfile.mkstemp()
     try:
         with os.fdopen(fd, 'wb') as tmp:
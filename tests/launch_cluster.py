@@ -66,7 +66,9 @@ master_ip = master_node.public_ip_address.exploded
 # from the default user to get an ACS token and then hit the IAM API directly.
 # Hopefully in the future there will be a simpler way to do it.
 if dcos_variant == 'open':
-    response = requests.post(
+    session = requests.Session()
+
+    response = session.post(
         'http://' + master_ip + '/acs/api/v1/auth/login',
         headers={"Content-Type" : "application/json"},
         data=json.dumps({
@@ -78,7 +80,7 @@ if dcos_variant == 'open':
         print("Couldn't login.", file=sys.stderr)
         sys.exit(1)
 
-    response = requests.put(
+    response = session.put(
         'http://' + master_ip + '/acs/api/v1/users/' + username,
         headers={
             "Authorization" : "token=" + response.json().get('token'),